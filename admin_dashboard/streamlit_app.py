@@ -1,12 +1,15 @@
 import os
-from datetime import datetime, timezone
+import time
 from typing import Any, Dict, List, Optional
 
 import altair as alt
+import numpy as np
 import pandas as pd
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
 from supabase import Client, create_client
+from urllib3.util.retry import Retry
 
 st.set_page_config(
     page_title="Sora Jobs Admin Dashboard",
@@ -30,6 +33,14 @@ STATUS_CANONICAL_MAP = {
     "policy_blocked": "failed",
 }
 
+# Exact-match lookup covering the casings providers realistically emit, so
+# the common path never has to lowercase the status column.
+STATUS_LOOKUP_MAP = {
+    variant: canonical
+    for status, canonical in STATUS_CANONICAL_MAP.items()
+    for variant in (status, status.upper(), status.title())
+}
+
 STATUS_DISPLAY_LABELS = {
     "queued": "Queued",
     "processing": "Processing",
@@ -40,12 +51,31 @@ STATUS_DISPLAY_LABELS = {
     "other": "Other",
 }
 
+JOB_COLUMNS = (
+    "id",
+    "user_id",
+    "status",
+    "provider",
+    "provider_status",
+    "queue_position",
+    "provider_error",
+    "video_url",
+    "created_at",
+    "updated_at",
+    "provider_last_checked",
+)
 
-def canonicalize_status(value: Optional[str]) -> str:
-    if not value:
-        return "other"
-    normalized = value.lower()
-    return STATUS_CANONICAL_MAP.get(normalized, "other")
+# Stored as Arrow-backed strings so masks and concatenation stay vectorized.
+TEXT_COLUMNS = (
+    "id",
+    "user_id",
+    "status",
+    "provider_status",
+    "provider_error",
+    "video_url",
+)
+
+JOBS_CACHE_SECONDS = 30
 
 
 def sanitize_env(value: Optional[str]) -> Optional[str]:
@@ -72,12 +102,25 @@ def get_supabase_client() -> Client:
     return create_client(url, service_key)
 
 
-@st.cache_data(ttl=30)
-def fetch_jobs(limit: int) -> pd.DataFrame:
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    session = requests.Session()
+    # The poller GET mutates jobs, so only retry failed connects, never reads.
+    retries = Retry(total=1, read=0, status=0)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@st.cache_data(ttl=JOBS_CACHE_SECONDS)
+def fetch_jobs(limit: int, cache_bucket: int) -> pd.DataFrame:
+    # cache_bucket only feeds the memoization key so reruns within the same
+    # window share one Supabase round-trip.
     client = get_supabase_client()
     response = (
         client.table("jobs")
-        .select("*")
+        .select(",".join(JOB_COLUMNS))
         .order("created_at", desc=True)
         .limit(limit)
         .execute()
@@ -87,25 +130,57 @@ def fetch_jobs(limit: int) -> pd.DataFrame:
         raise RuntimeError(response.error.message)
 
     data: List[Dict[str, Any]] = response.data or []
-    if not data:
-        return pd.DataFrame()
+    return prepare_jobs(pd.DataFrame(data))
+
 
-    frame = pd.DataFrame(data)
+def prepare_jobs(raw_frame: pd.DataFrame) -> pd.DataFrame:
+    if raw_frame.empty:
+        return raw_frame
+
+    # Derive every column from the raw frame first, then build the result in
+    # one concat rather than inserting columns one at a time.
+    derived: Dict[str, pd.Series] = {}
+    for column in TEXT_COLUMNS:
+        if column in raw_frame.columns:
+            derived[column] = raw_frame[column].astype("string[pyarrow]")
     for column in ["created_at", "updated_at", "provider_last_checked"]:
-        if column in frame.columns:
-            frame[column] = pd.to_datetime(
-                frame[column], utc=True, errors="coerce"
+        if column in raw_frame.columns:
+            derived[column] = pd.to_datetime(
+                raw_frame[column],
+                utc=True,
+                errors="coerce",
+                format="ISO8601",
+                cache=True,
             )
-    if "status" in frame.columns:
-        frame["canonical_status"] = frame["status"].apply(
-            lambda value: canonicalize_status(value if isinstance(value, str) else str(value) if value is not None else None)
-        )
+    if "status" in derived:
+        raw_status = derived["status"]
+        # Only values outside the precomputed casings need lowercasing.
+        canonical_status = raw_status.map(STATUS_LOOKUP_MAP)
+        needs_lower = canonical_status.isna() & raw_status.notna()
+        if needs_lower.any():
+            canonical_status.loc[needs_lower] = (
+                raw_status.loc[needs_lower].str.lower().map(STATUS_CANONICAL_MAP)
+            )
+        canonical_status = canonical_status.fillna("other")
     else:
-        frame["canonical_status"] = "other"
-    frame["status_display"] = frame["canonical_status"].map(
-        lambda value: STATUS_DISPLAY_LABELS.get(value, "Other")
+        canonical_status = pd.Series("other", index=raw_frame.index)
+    derived["status_display"] = canonical_status.map(STATUS_DISPLAY_LABELS).fillna(
+        "Other"
+    )
+    # Low-cardinality columns drive every filter, chart, and metric downstream.
+    derived["canonical_status"] = canonical_status.astype("category")
+    derived["provider"] = (
+        raw_frame.get("provider", pd.Series("fal", index=raw_frame.index))
+        .fillna("fal")
+        .astype("category")
+    )
+    return pd.concat(
+        [
+            raw_frame.drop(columns=list(derived), errors="ignore"),
+            pd.DataFrame(derived),
+        ],
+        axis=1,
     )
-    return frame
 
 
 def trigger_poller(limit: int) -> Dict[str, Any]:
@@ -122,10 +197,10 @@ def trigger_poller(limit: int) -> Dict[str, Any]:
 
     url = f"{base_url.rstrip('/')}/api/sora/poller?limit={limit}"
     try:
-        response = requests.get(
+        response = get_http_session().get(
             url,
             headers={"Authorization": f"Bearer {admin_token}"},
-            timeout=30,
+            timeout=(3.05, 27),
         )
         payload = response.json() if response.headers.get("content-type", "").startswith("application/json") else {}
         if not response.ok:
@@ -173,7 +248,7 @@ jobs_limit = st.selectbox(
 )
 
 try:
-    jobs_df = fetch_jobs(jobs_limit)
+    jobs_df = fetch_jobs(jobs_limit, int(time.time() // JOBS_CACHE_SECONDS))
 except RuntimeError as error:
     st.error(f"Failed to load jobs: {error}")
     st.stop()
@@ -182,13 +257,12 @@ if jobs_df.empty:
     st.info("No jobs found in Supabase. Launch a generation to populate data.")
     st.stop()
 
-jobs_df["provider"] = jobs_df.get("provider", "fal").fillna("fal")
-
-now_utc = datetime.now(timezone.utc)
 jobs_df["last_touched_at"] = jobs_df["updated_at"].fillna(jobs_df["created_at"])
-jobs_df["minutes_since_update"] = (
-    (now_utc - jobs_df["last_touched_at"]).dt.total_seconds() / 60.0
-)
+now_ns = pd.Timestamp.now(tz="UTC").value
+touched_ns = jobs_df["last_touched_at"].dt.as_unit("ns").values.view("i8")
+minutes_since_update = (now_ns - touched_ns) / 6.0e10
+minutes_since_update[touched_ns == np.iinfo(np.int64).min] = np.nan
+jobs_df["minutes_since_update"] = minutes_since_update
 
 active_mask = jobs_df["canonical_status"].isin(["queued", "processing"])
 stuck_mask = active_mask & (jobs_df["minutes_since_update"] >= 10)
@@ -209,25 +283,18 @@ selected_statuses = st.multiselect(
     format_func=lambda value: STATUS_DISPLAY_LABELS.get(value, value.title()),
 )
 
-filtered_df = jobs_df[
+# Read-only below, so a plain boolean selection is enough.
+filtered_df = jobs_df.loc[
     jobs_df["provider"].isin(selected_providers)
     & jobs_df["canonical_status"].isin(selected_statuses)
-].copy()
+]
 
+status_totals = filtered_df["canonical_status"].value_counts()
 summary_cols = st.columns(5)
 summary_cols[0].metric("Total jobs", len(filtered_df))
-summary_cols[1].metric(
-    "Queued",
-    int((filtered_df["canonical_status"] == "queued").sum()),
-)
-summary_cols[2].metric(
-    "Processing",
-    int((filtered_df["canonical_status"] == "processing").sum()),
-)
-summary_cols[3].metric(
-    "Completed",
-    int((filtered_df["canonical_status"] == "completed").sum()),
-)
+summary_cols[1].metric("Queued", int(status_totals.get("queued", 0)))
+summary_cols[2].metric("Processing", int(status_totals.get("processing", 0)))
+summary_cols[3].metric("Completed", int(status_totals.get("completed", 0)))
 summary_cols[4].metric(
     "Flagged as stuck",
     int(filtered_df["is_stuck"].sum()),
@@ -239,7 +306,7 @@ with chart_container:
     left, right = st.columns([2, 3])
 
     status_counts = (
-        filtered_df.groupby(["provider", "canonical_status"])
+        filtered_df.groupby(["provider", "canonical_status"], observed=True)
         .size()
         .reset_index(name="count")
     )
@@ -260,14 +327,14 @@ with chart_container:
     left.subheader("Status mix per provider")
     left.altair_chart(status_chart, use_container_width=True)
 
-    timeline_df = filtered_df.copy()
-    timeline_df["timeline_bucket"] = (
-        timeline_df["last_touched_at"]
+    timeline_bucket = (
+        filtered_df["last_touched_at"]
         .dt.floor("15min")
         .dt.tz_convert(None)
+        .rename("timeline_bucket")
     )
     timeline_counts = (
-        timeline_df.groupby(["timeline_bucket", "provider"])
+        filtered_df.groupby([timeline_bucket, "provider"], observed=True)
         .size()
         .reset_index(name="active_jobs")
     )
@@ -304,13 +371,15 @@ table_df["minutes_since_update"] = table_df["minutes_since_update"].round(1)
 if "status_display" in table_df.columns:
     table_df = table_df.rename(columns={"status_display": "Status"})
 
-styled_df = table_df.style.apply(
-    lambda row: [
-        "background-color: #ffe4e6" if stuck else ""
-        for stuck in [filtered_df.loc[row.name, "is_stuck"]]
-    ],
-    axis=1,
+stuck_css = np.where(
+    filtered_df["is_stuck"].to_numpy(dtype=bool), "background-color: #ffe4e6", ""
+)[:, None]
+row_styles = pd.DataFrame(
+    np.broadcast_to(stuck_css, table_df.shape),
+    index=table_df.index,
+    columns=table_df.columns,
 )
+styled_df = table_df.style.apply(lambda _frame: row_styles, axis=None)
 
 st.dataframe(
     styled_df,
@@ -325,10 +394,18 @@ stuck_jobs = filtered_df[filtered_df["is_stuck"]]
 if stuck_jobs.empty:
     st.success("No stalled jobs detected in the last batch.")
 else:
-    for _, row in stuck_jobs.iterrows():
-        st.warning(
-            f"Job {row['id']} ({row['provider']}) stuck at status {row.get('status_display') or row.get('status')} "
-            f"for {row['minutes_since_update']:.1f} minutes. Provider status: "
-            f"{row.get('provider_status') or 'n/a'}",
-            icon="🛑",
-        )
+    provider_status = stuck_jobs["provider_status"]
+    stuck_messages = (
+        "Job "
+        + stuck_jobs["id"].astype(str)
+        + " ("
+        + stuck_jobs["provider"].astype(str)
+        + ") stuck at status "
+        + stuck_jobs["status_display"]
+        + " for "
+        + stuck_jobs["minutes_since_update"].round(1).astype(str)
+        + " minutes. Provider status: "
+        + provider_status.mask(provider_status.eq(""), "n/a").fillna("n/a").astype(str)
+    ).tolist()
+    # A single warning box for all stuck jobs rather than one per job.
+    st.warning("\n\n".join(stuck_messages), icon="🛑")